@@ -1,10 +1,15 @@
 import logging
+import select
+import subprocess
+import time
+from collections import deque
 
 from rich.progress import (
     Progress,
     TextColumn,
 )
 
+from ..constants import DETAIL_LEVEL
 from ..prompts import ExecuterPrompt
 from ..rich_logging import show_progress_bar
 from .base_agent import BaseAgent
@@ -23,11 +28,6 @@ def execute_code(code, language, timeout):
     Returns:
         tuple: (success: bool, stdout: str, stderr: str)
     """
-    import select
-    import subprocess
-    import time
-    from collections import deque
-
     try:
         # Set up the command based on language
         if language.lower() == "python":
@@ -54,6 +54,9 @@ def execute_code(code, language, timeout):
         # Set up tracking of both output streams
         streams = [process.stdout, process.stderr]
 
+        # Resolve once instead of per output line; training scripts can print many lines
+        log_output = logger.isEnabledFor(DETAIL_LEVEL)
+
         # Track start time for timeout
         start_time = time.time()
 
@@ -108,7 +111,8 @@ def execute_code(code, language, timeout):
                             continue
                         recent_stdout_lines.append(line)
                         stdout_chunks.append(line)
-                        logger.detail(line.rstrip())
+                        if log_output:
+                            logger.detail(line.rstrip())
                     # Handle stderr
                     else:
                         # Skip duplicate lines (exact match with any of the last 100 stderr lines)
@@ -116,7 +120,8 @@ def execute_code(code, language, timeout):
                             continue
                         recent_stderr_lines.append(line)
                         stderr_chunks.append(line)
-                        logger.detail(line.rstrip())
+                        if log_output:
+                            logger.detail(line.rstrip())
 
             elapsed_time = time.time() - start_time
             progress_context.update(task, completed=elapsed_time)
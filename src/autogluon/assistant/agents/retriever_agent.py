@@ -1,4 +1,5 @@
 import logging
+import os
 from typing import Any, Dict, List
 
 from autogluon.assistant.tools_registry.indexing import TutorialIndexer
@@ -164,8 +165,6 @@ class RetrieverAgent(BaseAgent):
             pass
 
         # Fallback: extract from file path
-        import os
-
         filename = os.path.splitext(os.path.basename(file_path))[0]
         return filename.replace("_", " ").replace("-", " ").title()
 
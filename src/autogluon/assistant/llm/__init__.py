@@ -1 +1,10 @@
-from .llm_factory import ChatLLMFactory
+__all__ = ["ChatLLMFactory"]
+
+
+def __getattr__(name):
+    # Importing the factory pulls in every provider SDK, so defer it until first use (PEP 562)
+    if name == "ChatLLMFactory":
+        from .llm_factory import ChatLLMFactory
+
+        return ChatLLMFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
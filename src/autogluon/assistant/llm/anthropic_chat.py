@@ -1,11 +1,11 @@
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List
 
 from anthropic import Anthropic
 from langchain_anthropic import ChatAnthropic
 
-from .base_chat import BaseAssistantChat
+from .base_chat import OPTIONAL_CONFIG_FIELDS, BaseAssistantChat, get_optional_kwargs
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class AssistantChatAnthropic(ChatAnthropic, BaseAssistantChat):
     """Anthropic chat model with LangGraph support."""
 
+    supports_prompt_caching: ClassVar[bool] = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.initialize_conversation(self)
@@ -40,25 +42,22 @@ def create_anthropic_chat(config, session_name: str) -> AssistantChatAnthropic:
     """Create an Anthropic chat model instance."""
     model = config.model
 
-    if "ANTHROPIC_API_KEY" not in os.environ:
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if api_key is None:
         raise ValueError("Anthropic API key not found in environment")
 
     logger.info(f"Using Anthropic model: {model} for session: {session_name}")
     kwargs = {
         "model": model,
-        "anthropic_api_key": os.environ["ANTHROPIC_API_KEY"],
+        "anthropic_api_key": api_key,
         "session_name": session_name,
         "max_tokens": config.max_tokens,
+        **get_optional_kwargs(config, OPTIONAL_CONFIG_FIELDS),
     }
 
-    if hasattr(config, "temperature"):
-        kwargs["temperature"] = config.temperature
-
-    if hasattr(config, "verbose"):
-        kwargs["verbose"] = config.verbose
-
     # Support for additional Anthropic-specific features
-    if hasattr(config, "thinking") and hasattr(config.thinking, "enabled"):
-        kwargs["thinking"] = config.thinking
+    thinking = getattr(config, "thinking", None)
+    if hasattr(thinking, "enabled"):
+        kwargs["thinking"] = thinking
 
     return AssistantChatAnthropic(**kwargs)
@@ -5,7 +5,7 @@ from typing import Any, Dict, List
 from langchain_openai import AzureChatOpenAI
 from openai import AzureOpenAI
 
-from .base_chat import BaseAssistantChat
+from .base_chat import OPTIONAL_CONFIG_FIELDS, BaseAssistantChat, get_optional_kwargs
 
 logger = logging.getLogger(__name__)
 
@@ -37,26 +37,24 @@ def create_azure_openai_chat(config, session_name: str) -> AssistantAzureChatOpe
     model = config.model
 
     logger.info(f"Using Azure OpenAI model: {model} for session: {session_name}")
-    if "AZURE_OPENAI_API_KEY" not in os.environ:
+    api_key = os.environ.get("AZURE_OPENAI_API_KEY")
+    api_version = os.environ.get("OPENAI_API_VERSION")
+    azure_endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
+    if api_key is None:
         raise ValueError("Azure OpenAI API key not found in environment")
-    if "OPENAI_API_VERSION" not in os.environ:
+    if api_version is None:
         raise Exception("Azure API env variable OPENAI_API_VERSION not set")
-    if "AZURE_OPENAI_ENDPOINT" not in os.environ:
+    if azure_endpoint is None:
         raise Exception("Azure API env variable AZURE_OPENAI_ENDPOINT not set")
 
     kwargs = {
         "model_name": model,
-        "openai_api_key": os.environ["AZURE_OPENAI_API_KEY"],
-        "api_version": os.environ["OPENAI_API_VERSION"],
-        "azure_endpoint": os.environ["AZURE_OPENAI_ENDPOINT"],
+        "openai_api_key": api_key,
+        "api_version": api_version,
+        "azure_endpoint": azure_endpoint,
         "session_name": session_name,
         "max_tokens": config.max_tokens,
+        **get_optional_kwargs(config, OPTIONAL_CONFIG_FIELDS),
     }
 
-    if hasattr(config, "temperature"):
-        kwargs["temperature"] = config.temperature
-
-    if hasattr(config, "verbose"):
-        kwargs["verbose"] = config.verbose
-
     return AssistantAzureChatOpenAI(**kwargs)
@@ -1,18 +1,117 @@
+import asyncio
+import contextlib
+import itertools
 import json
 import logging
 import os
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, ClassVar, Deque, Dict, List, Optional, Tuple, Union
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import StructuredTool
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import START, MessagesState, StateGraph
+from langgraph.prebuilt import ToolNode, tools_condition
 from pydantic import BaseModel, ConfigDict, Field
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Model calls without native async support run in the loop's executor; they wait on the network, so
+# the pool is sized for concurrent requests rather than CPU count
+BACKGROUND_LOOP_WORKERS = 64
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_thread: Optional[threading.Thread] = None
+_background_loop_lock = threading.Lock()
+_token_tracker_lock = threading.Lock()
+
+
+def _content_to_text(content: Any) -> str:
+    """Flatten message content, which may be a string or a list of content blocks, into text."""
+    if isinstance(content, str):
+        return content
+    parts = []
+    for block in content or []:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+    return "".join(parts)
+
+
+def _has_cache_control(message: Any) -> bool:
+    return isinstance(message.content, list) and any(
+        isinstance(block, dict) and "cache_control" in block for block in message.content
+    )
+
+
+def _keep_last_cache_breakpoint(messages: List[Any]) -> List[Any]:
+    """Return the messages with cache_control removed from all but the latest message carrying it.
+
+    Anthropic rejects requests with more than four cache breakpoints, and a conversation gains a
+    marked message whenever its cacheable prefix changes. The stored messages are not modified.
+    """
+    marked = [i for i, msg in enumerate(messages) if _has_cache_control(msg)]
+    if len(marked) <= 1:
+        return messages
+    stripped = list(messages)
+    for i in marked[:-1]:
+        content = [
+            {k: v for k, v in block.items() if k != "cache_control"} if isinstance(block, dict) else block
+            for block in messages[i].content
+        ]
+        stripped[i] = messages[i].model_copy(update={"content": content})
+    return stripped
+
+
+# (config attribute, model keyword argument) pairs that every chat model passes through only when set
+# in the config, so unset options keep the provider defaults
+OPTIONAL_CONFIG_FIELDS = (("temperature", "temperature"), ("verbose", "verbose"))
+
+
+def get_optional_kwargs(config: Any, fields: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Collect the config attributes that are set, keyed by the model keyword argument they map to.
+
+    Args:
+        config: LLM config object
+        fields: Pairs of (config attribute, model keyword argument)
+    """
+    kwargs = {}
+    for attr, key in fields:
+        value = getattr(config, attr, _MISSING)
+        if value is not _MISSING:
+            kwargs[key] = value
+    return kwargs
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used for async dispatch, starting it on first use.
+
+    The loop runs forever in a daemon thread and is shared by every chat model. Single-turn agents
+    build a new chat model per call, so a loop per model would still pay loop and thread setup each time.
+    """
+    global _background_loop, _background_loop_thread
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=BACKGROUND_LOOP_WORKERS, thread_name_prefix="assistant_chat_io")
+            )
+            thread = threading.Thread(target=loop.run_forever, name="assistant_chat_loop", daemon=True)
+            thread.start()
+            _background_loop = loop
+            _background_loop_thread = thread
+    return _background_loop
+
 
 def log_retry_attempt(retry_state):
     """Custom callback to log each retry attempt"""
@@ -22,18 +121,72 @@ def log_retry_attempt(retry_state):
         logger.error(f"Attempt {attempt_number} failed: {type(exception).__name__}: {exception}")
 
 
+# Shared by assistant_chat and every batch item, so throttled requests back off the same way
+_RETRY_POLICY = {
+    "stop": stop_after_attempt(6),
+    "wait": wait_exponential(multiplier=32, min=32, max=128),
+    "after": log_retry_attempt,
+}
+
+
+@dataclass(slots=True)
+class ChatTurn:
+    """Response and summed token usage of one chat turn."""
+
+    text: Any = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+    def add_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """Accumulate a LangChain usage_metadata dict; messages without usage report None."""
+        if not usage:
+            return
+        input_details = usage.get("input_token_details") or {}
+        self.input_tokens += usage.get("input_tokens", 0)
+        self.output_tokens += usage.get("output_tokens", 0)
+        self.cache_read_tokens += input_details.get("cache_read") or 0
+        self.cache_creation_tokens += input_details.get("cache_creation") or 0
+
+    @classmethod
+    def from_messages(cls, messages: List[Any]) -> "ChatTurn":
+        """Build the turn from graph output, summing usage over every message after the latest user message.
+
+        A turn with tool calls contains several model responses, each billed separately.
+        """
+        turn = cls(text=messages[-1].content)
+        for msg in reversed(messages):
+            if isinstance(msg, HumanMessage):
+                break
+            # usage_metadata is absent on non-AI messages
+            turn.add_usage(getattr(msg, "usage_metadata", None))
+        return turn
+
+    @property
+    def has_usage(self) -> bool:
+        """Whether the provider reported any usage for this turn."""
+        return any((self.input_tokens, self.output_tokens, self.cache_read_tokens, self.cache_creation_tokens))
+
+
 class GlobalTokenTracker:
     """Singleton class to track token usage across all conversations."""
 
     _instance = None
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(GlobalTokenTracker, cls).__new__(cls)
-            cls._instance.total_input_tokens = 0
-            cls._instance.total_output_tokens = 0
-            cls._instance.conversations = {}  # Track per-conversation usage
-            cls._instance.sessions = {}  # Track per-session usage
+        # Chat models are created from several threads at once, so build the instance fully before publishing it
+        with _token_tracker_lock:
+            if cls._instance is None:
+                instance = super(GlobalTokenTracker, cls).__new__(cls)
+                instance.total_input_tokens = 0
+                instance.total_output_tokens = 0
+                instance.total_cache_read_tokens = 0  # Subset of input tokens served from the prompt cache
+                instance.total_cache_creation_tokens = 0  # Subset of input tokens written to the prompt cache
+                instance.conversations = {}  # Track per-conversation usage
+                instance.sessions = {}  # Track per-session usage
+                instance.lock = threading.Lock()  # Chat models may be used from several threads
+                cls._instance = instance
         return cls._instance
 
     def add_tokens(
@@ -42,71 +195,81 @@ class GlobalTokenTracker:
         session_name: str,
         input_tokens: int,
         output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
     ):
         """Add token counts for a specific conversation and session."""
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-
-        # Track conversation-level usage
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = {
-                "input_tokens": 0,
-                "output_tokens": 0,
-            }
+        with self.lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cache_read_tokens += cache_read_tokens
+            self.total_cache_creation_tokens += cache_creation_tokens
 
-        self.conversations[conversation_id]["input_tokens"] += input_tokens
-        self.conversations[conversation_id]["output_tokens"] += output_tokens
+            # Track conversation-level usage
+            if conversation_id not in self.conversations:
+                self.conversations[conversation_id] = {
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                }
 
-        # Track session-level usage
-        if session_name not in self.sessions:
-            self.sessions[session_name] = {"input_tokens": 0, "output_tokens": 0}
+            self.conversations[conversation_id]["input_tokens"] += input_tokens
+            self.conversations[conversation_id]["output_tokens"] += output_tokens
 
-        self.sessions[session_name]["input_tokens"] += input_tokens
-        self.sessions[session_name]["output_tokens"] += output_tokens
+            # Track session-level usage
+            if session_name not in self.sessions:
+                self.sessions[session_name] = {"input_tokens": 0, "output_tokens": 0}
+
+            self.sessions[session_name]["input_tokens"] += input_tokens
+            self.sessions[session_name]["output_tokens"] += output_tokens
 
     def get_conversation_usage(self, conversation_id: str) -> Dict[str, Any]:
         """Get token usage for a specific conversation."""
-        if conversation_id not in self.conversations:
+        with self.lock:
+            if conversation_id not in self.conversations:
+                return {
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "total_tokens": 0,
+                }
+
+            conv_usage = self.conversations[conversation_id]
             return {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "total_tokens": 0,
+                "input_tokens": conv_usage["input_tokens"],
+                "output_tokens": conv_usage["output_tokens"],
+                "total_conversation_tokens": conv_usage["input_tokens"] + conv_usage["output_tokens"],
             }
 
-        conv_usage = self.conversations[conversation_id]
-        return {
-            "input_tokens": conv_usage["input_tokens"],
-            "output_tokens": conv_usage["output_tokens"],
-            "total_conversation_tokens": conv_usage["input_tokens"] + conv_usage["output_tokens"],
-        }
-
     def get_total_usage(self, save_path: Optional[str] = None) -> Dict[str, Any]:
         """Get total token usage across all conversations and sessions."""
-        usage_data = {
-            "total": {
-                "total_input_tokens": self.total_input_tokens,
-                "total_output_tokens": self.total_output_tokens,
-                "total_tokens": self.total_input_tokens + self.total_output_tokens,
-            },
-            "conversations": {},
-            "sessions": {},
-        }
-
-        # Add conversation-level usage
-        for conv_id, conv_usage in self.conversations.items():
-            usage_data["conversations"][conv_id] = {
-                "input_tokens": conv_usage["input_tokens"],
-                "output_tokens": conv_usage["output_tokens"],
-                "total_tokens": conv_usage["input_tokens"] + conv_usage["output_tokens"],
+        # Snapshot under the lock; other threads may add conversations while this runs
+        with self.lock:
+            usage_data = {
+                "total": {
+                    "total_input_tokens": self.total_input_tokens,
+                    "total_output_tokens": self.total_output_tokens,
+                    "total_tokens": self.total_input_tokens + self.total_output_tokens,
+                    "total_cache_read_tokens": self.total_cache_read_tokens,
+                    "total_cache_creation_tokens": self.total_cache_creation_tokens,
+                },
+                "conversations": {},
+                "sessions": {},
             }
 
-        # Add session-level usage
-        for session_name, session_usage in self.sessions.items():
-            usage_data["sessions"][session_name] = {
-                "input_tokens": session_usage["input_tokens"],
-                "output_tokens": session_usage["output_tokens"],
-                "total_tokens": session_usage["input_tokens"] + session_usage["output_tokens"],
-            }
+            # Add conversation-level usage
+            for conv_id, conv_usage in self.conversations.items():
+                usage_data["conversations"][conv_id] = {
+                    "input_tokens": conv_usage["input_tokens"],
+                    "output_tokens": conv_usage["output_tokens"],
+                    "total_tokens": conv_usage["input_tokens"] + conv_usage["output_tokens"],
+                }
+
+            # Add session-level usage
+            for session_name, session_usage in self.sessions.items():
+                usage_data["sessions"][session_name] = {
+                    "input_tokens": session_usage["input_tokens"],
+                    "output_tokens": session_usage["output_tokens"],
+                    "total_tokens": session_usage["input_tokens"] + session_usage["output_tokens"],
+                }
 
         # Save to file if path is provided
         if save_path:
@@ -122,9 +285,19 @@ class BaseAssistantChat(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    history_: List[Dict[str, Any]] = Field(default_factory=list)
+    # Whether the provider accepts Anthropic-style cache_control content blocks
+    supports_prompt_caching: ClassVar[bool] = False
+    # Whether the model can bind tools registered with register_tool
+    supports_tools: ClassVar[bool] = True
+    # Whether the model streams chat message chunks that assistant_chat_stream can forward
+    supports_streaming: ClassVar[bool] = True
+
+    history_: Deque[Dict[str, Any]] = Field(default_factory=deque)
+    history_max: int = Field(default=1000)  # Oldest turns are dropped beyond this many
     input_tokens_: int = Field(default=0)
     output_tokens_: int = Field(default=0)
+    cache_read_tokens_: int = Field(default=0)
+    cache_creation_tokens_: int = Field(default=0)
     graph: Optional[Any] = Field(default=None, exclude=True)
     app: Optional[Any] = Field(default=None, exclude=True)
     memory: Optional[Any] = Field(default=None, exclude=True)
@@ -132,13 +305,35 @@ class BaseAssistantChat(BaseModel):
     conversation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     session_name: str = Field(default="default_session")
     thread_id: str = Field(default_factory=lambda: str(uuid.uuid4()))  # Reuse same thread_id per session
+    graph_config: Dict[str, Any] = Field(default_factory=dict, exclude=True)
+    system_prompt: str = Field(default="", exclude=True)
+    registered_tools: List[Any] = Field(default_factory=list, exclude=True)  # In-process tools bound to the model
+    # Model the graph was built from when it is not this instance; kept to rebuild the graph on tool changes
+    chat_model_: Optional[Any] = Field(default=None, exclude=True, repr=False)
 
     def initialize_conversation(
         self,
         llm: Any,
         system_prompt: str = "",
     ) -> None:
-        """Initialize conversation using LangGraph."""
+        """Initialize conversation using LangGraph.
+
+        Registered tools are bound to the model and executed in-process by a ToolNode. Re-initializing
+        keeps the existing checkpointer, so the conversation so far is preserved.
+        """
+        graph, app, memory = self._compile_graph(llm, system_prompt, self.registered_tools)
+
+        self.graph = graph
+        self.app = app
+        self.memory = memory
+        if self.history_.maxlen != self.history_max:
+            self.history_ = deque(self.history_, maxlen=self.history_max)
+        self.system_prompt = system_prompt
+        self.chat_model_ = None if llm is self else llm
+        self.graph_config = {"configurable": {"thread_id": self.thread_id}}
+
+    def _compile_graph(self, llm: Any, system_prompt: str, tools: List[Any]) -> Tuple[Any, Any, Any]:
+        """Build and compile the conversation graph, returning (graph, app, memory) without changing state."""
         prompt_template = ChatPromptTemplate.from_messages(
             [
                 SystemMessage(content=system_prompt),
@@ -146,22 +341,81 @@ class BaseAssistantChat(BaseModel):
             ]
         )
 
+        model = llm.bind_tools(tools) if tools else llm
         graph = StateGraph(state_schema=MessagesState)
 
+        def build_prompt(state: MessagesState) -> List[Any]:
+            prompt_messages = prompt_template.invoke(state).to_messages()
+            if self.supports_prompt_caching:
+                prompt_messages = _keep_last_cache_breakpoint(prompt_messages)
+            return prompt_messages
+
         def call_model(state: MessagesState):
-            prompt_messages = prompt_template.invoke(state)
-            response = llm.invoke(prompt_messages)
+            response = model.invoke(build_prompt(state))
+            return {"messages": [response]}
+
+        async def acall_model(state: MessagesState):
+            response = await model.ainvoke(build_prompt(state))
             return {"messages": [response]}
 
         graph.add_edge(START, "model")
-        graph.add_node("model", call_model)
+        # Batch, fork and stream run the graph asynchronously; the async node awaits the provider call
+        # instead of holding an executor thread for it
+        graph.add_node("model", RunnableLambda(call_model, afunc=acall_model))
 
-        memory = MemorySaver()
+        if tools:
+            # Tool calls from one model turn are executed concurrently by the ToolNode
+            graph.add_node("tools", ToolNode(tools))
+            graph.add_conditional_edges("model", tools_condition)
+            graph.add_edge("tools", "model")
+
+        memory = self.memory or MemorySaver()
         app = graph.compile(checkpointer=memory)
 
-        self.graph = graph
-        self.app = app
-        self.memory = memory
+        return graph, app, memory
+
+    def register_tool(self, name: str, fn: Callable[..., Any], description: Optional[str] = None) -> None:
+        """Expose a Python callable to the model as a tool.
+
+        The tool runs in this process when the model calls it, with no subprocess or MCP server in
+        between, so prefer this for file or code helpers that are called often. Registering a tool
+        with an existing name replaces it.
+
+        Args:
+            name: Tool name shown to the model
+            fn: Callable implementing the tool; its signature defines the tool arguments
+            description: Tool description; defaults to the callable's docstring
+
+        Raises:
+            NotImplementedError: If the model cannot bind tools
+        """
+        if not self.supports_tools:
+            raise NotImplementedError(f"{type(self).__name__} does not support tool calling")
+
+        tool = StructuredTool.from_function(fn, name=name, description=description)
+        tools = [t for t in self.registered_tools if t.name != name] + [tool]
+        if self.app:
+            # Build the new graph before recording the tool, so a failure leaves the model unchanged
+            llm = self.chat_model_ if self.chat_model_ is not None else self
+            self.graph, self.app, self.memory = self._compile_graph(llm, self.system_prompt, tools)
+        self.registered_tools = tools
+
+    def _run_coroutine(self, coro) -> Any:
+        """Run a coroutine on the background event loop and block until it finishes."""
+        if threading.current_thread() is _background_loop_thread:
+            # Blocking here would wait forever on the loop this thread is supposed to run
+            coro.close()
+            raise RuntimeError(
+                "Synchronous chat calls cannot be made from the background event loop thread, "
+                "e.g. from an assistant_chat_batch on_progress callback"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
+
+    def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the recorded turns, oldest first, optionally only the latest limit of them."""
+        if limit is None:
+            return list(self.history_)
+        return list(itertools.islice(self.history_, max(len(self.history_) - limit, 0), None))
 
     def describe(self) -> Dict[str, Any]:
         """Get model description and conversation history."""
@@ -169,56 +423,254 @@ class BaseAssistantChat(BaseModel):
         total_usage = self.token_tracker.get_total_usage()
 
         return {
-            "history": self.history_,
+            "history": self.get_history(),
             "conversation_tokens": conversation_usage,
             "total_tokens_across_all_conversations": total_usage,
             "session_name": self.session_name,
         }
 
-    @retry(stop=stop_after_attempt(6), wait=wait_exponential(multiplier=32, min=32, max=128), after=log_retry_attempt)
-    def assistant_chat(self, message: str) -> str:
-        """Send a message and get response using LangGraph."""
+    @retry(**_RETRY_POLICY)
+    def assistant_chat(self, message: str, cacheable_prefix: Optional[str] = None) -> str:
+        """Send a message and get response using LangGraph.
+
+        Args:
+            message: The prompt to send
+            cacheable_prefix: Optional stable context prepended verbatim to the message. Providers that
+                support prompt caching mark it as a cache breakpoint so repeated prefixes are billed and
+                processed at the cached rate. A prefix already sent in this conversation is not sent
+                again, since the model sees it in the earlier turn.
+        """
         if not self.app:
             raise RuntimeError("Conversation not initialized. Call initialize_conversation first.")
 
+        if cacheable_prefix and self._conversation_has_prefix(cacheable_prefix):
+            cacheable_prefix = None
+
         # Reuse the same thread_id for multi-turn conversations
-        config = {"configurable": {"thread_id": self.thread_id}}
-        input_messages = [HumanMessage(content=message)]
-        response = self.app.invoke({"messages": input_messages}, config)
+        input_messages = [self._build_human_message(message, cacheable_prefix)]
+        response = self.app.invoke({"messages": input_messages}, self.graph_config)
+
+        return self._record_turn(message, ChatTurn.from_messages(response["messages"]))
+
+    def assistant_chat_batch(
+        self,
+        messages: List[str],
+        max_concurrency: int = 8,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+    ) -> List[Union[str, BaseException]]:
+        """Send independent messages concurrently and return the responses in input order.
+
+        Each message runs in its own fork of the multi-turn conversation, so batch items see the
+        earlier turns but neither see each other nor modify the conversation. Each item is retried
+        with the same policy as assistant_chat; an item that still fails is returned as its exception
+        instead of being raised.
+
+        Args:
+            messages: Prompts to send
+            max_concurrency: Maximum number of requests in flight at once
+            on_progress: Optional callback invoked with (index, response) as each item completes. It runs
+                on the background event loop thread shared by all chat models, so it must be quick and
+                must not call the synchronous batch or fork APIs.
+        """
+        if not self.app:
+            raise RuntimeError("Conversation not initialized. Call initialize_conversation first.")
+
+        results = self._run_coroutine(self._abatch(messages, max_concurrency, on_progress))
+
+        # Record usage and history in the calling thread once all items have finished
+        responses = []
+        for message, result in zip(messages, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Batch item failed: {type(result).__name__}: {result}")
+                responses.append(result)
+            else:
+                responses.append(self._record_turn(message, ChatTurn.from_messages(result)))
+        return responses
+
+    async def _abatch(
+        self,
+        messages: List[str],
+        max_concurrency: int,
+        on_progress: Optional[Callable[[int, str], None]],
+    ) -> List[Any]:
+        """Invoke the graph for each message concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Snapshot the conversation once; every item forks from the same state
+        base_messages = await self._aget_conversation_messages()
+
+        async def invoke_one(index: int, message: str):
+            async with semaphore:
+                # Concurrent items are the most likely to be throttled; once attempts run out the
+                # original exception is returned for the item
+                async for attempt in AsyncRetrying(reraise=True, **_RETRY_POLICY):
+                    with attempt:
+                        response_messages = await self._ainvoke_fork(message, base_messages)
+            if on_progress:
+                try:
+                    on_progress(index, response_messages[-1].content)
+                except Exception as e:
+                    # The response is already billed, so a failing callback must not replace it
+                    logger.error(f"on_progress failed for batch item {index}: {type(e).__name__}: {e}")
+            return response_messages
+
+        return await asyncio.gather(*(invoke_one(i, m) for i, m in enumerate(messages)), return_exceptions=True)
+
+    def assistant_chat_fork(self, message: str) -> str:
+        """Send a message on a branch of the multi-turn conversation.
+
+        The branch starts from the conversation so far, copied from the checkpoint rather than
+        replayed, and its turn is not added to the conversation. Useful for exploratory queries
+        that should not steer later turns.
+        """
+        if not self.app:
+            raise RuntimeError("Conversation not initialized. Call initialize_conversation first.")
 
-        ai_message = response["messages"][-1]
-        input_tokens = output_tokens = 0
+        response_messages = self._run_coroutine(self._afork(message))
+        return self._record_turn(message, ChatTurn.from_messages(response_messages))
 
-        if hasattr(ai_message, "usage_metadata"):
-            usage = ai_message.usage_metadata
-            input_tokens = usage.get("input_tokens", 0)
-            output_tokens = usage.get("output_tokens", 0)
+    async def _afork(self, message: str) -> Any:
+        """Fork the conversation and run a message on the fork."""
+        base_messages = await self._aget_conversation_messages()
+        return await self._ainvoke_fork(message, base_messages)
 
-            # Update both instance and global tracking
-            self.input_tokens_ += input_tokens
-            self.output_tokens_ += output_tokens
-            self.token_tracker.add_tokens(self.conversation_id, self.session_name, input_tokens, output_tokens)
+    async def _aget_conversation_messages(self) -> List[Any]:
+        """Return the messages of the multi-turn conversation from the checkpoint."""
+        state = await self.app.aget_state(self.graph_config)
+        return state.values.get("messages", [])
+
+    async def _ainvoke_fork(self, message: str, base_messages: List[Any]) -> Any:
+        """Run a message in a temporary thread seeded with base_messages and return the thread's messages."""
+        async with self._afork_thread(base_messages) as config:
+            response = await self.app.ainvoke({"messages": [HumanMessage(content=message)]}, config)
+        return response["messages"]
+
+    @contextlib.asynccontextmanager
+    async def _afork_thread(self, base_messages: List[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the config of a temporary thread seeded with base_messages, deleting the thread afterwards."""
+        thread_id = str(uuid.uuid4())
+        config = {"configurable": {"thread_id": thread_id}}
+        try:
+            if base_messages:
+                await self.app.aupdate_state(config, {"messages": base_messages}, as_node="model")
+            yield config
+        finally:
+            # Forks are single-use, so drop their checkpoints instead of keeping them in memory
+            await self.memory.adelete_thread(thread_id)
+
+    def _conversation_has_prefix(self, prefix: str) -> bool:
+        """Whether a user message in the multi-turn conversation already starts with prefix."""
+        messages = self.app.get_state(self.graph_config).values.get("messages", [])
+        return any(
+            isinstance(msg, HumanMessage) and _content_to_text(msg.content).startswith(prefix) for msg in messages
+        )
+
+    def _build_human_message(self, message: str, cacheable_prefix: Optional[str] = None) -> HumanMessage:
+        """Build the user message, marking the cacheable prefix when the provider supports it."""
+        if not cacheable_prefix:
+            return HumanMessage(content=message)
+        if not self.supports_prompt_caching:
+            return HumanMessage(content=cacheable_prefix + message)
+        return HumanMessage(
+            content=[
+                {"type": "text", "text": cacheable_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": message},
+            ]
+        )
+
+    def _record_turn(self, message: str, turn: ChatTurn) -> Any:
+        """Update token usage and history for a completed turn and return the response text."""
+        if turn.has_usage:
+            # Update both instance and global tracking, once per turn
+            self.input_tokens_ += turn.input_tokens
+            self.output_tokens_ += turn.output_tokens
+            self.cache_read_tokens_ += turn.cache_read_tokens
+            self.cache_creation_tokens_ += turn.cache_creation_tokens
+            self.token_tracker.add_tokens(
+                self.conversation_id,
+                self.session_name,
+                turn.input_tokens,
+                turn.output_tokens,
+                cache_read_tokens=turn.cache_read_tokens,
+                cache_creation_tokens=turn.cache_creation_tokens,
+            )
 
         self.history_.append(
             {
                 "input": message,
-                "output": ai_message.content,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
+                "output": turn.text,
+                "input_tokens": turn.input_tokens,
+                "output_tokens": turn.output_tokens,
             }
         )
 
-        return ai_message.content
+        return turn.text
+
+    async def assistant_chat_stream(self, message: str) -> AsyncIterator[str]:
+        """Stream the response text for a message as it is generated.
 
-    async def astream(self, message: str):
-        """Stream responses using LangGraph."""
+        Chunks that arrive while the consumer is still handling the previous one are coalesced
+        into a single string, so fast token streams do not pay per-chunk overhead downstream.
+        Like assistant_chat_fork, each call runs on a fork of the multi-turn conversation: the model
+        sees the earlier turns, but the streamed turn is not added to the conversation. Usage summed
+        over all chunks and the full response are recorded once the stream completes; if the consumer
+        closes the stream early or it fails, the usage and text received so far are recorded.
+
+        Raises:
+            NotImplementedError: If the model does not stream chat message chunks
+        """
+        if not self.supports_streaming:
+            raise NotImplementedError(f"{type(self).__name__} does not support streaming")
         if not self.app:
             raise RuntimeError("Conversation not initialized. Call initialize_conversation first.")
 
-        thread_id = str(uuid.uuid4())
-        config = {"configurable": {"thread_id": thread_id}}
+        queue: asyncio.Queue = asyncio.Queue()
+        end_of_stream = object()
+        texts = []
+        turn = ChatTurn()
+
+        async def produce():
+            try:
+                async for text, usage in self._aiter_stream_chunks(message):
+                    # Providers report usage incrementally across chunks, so add every report
+                    turn.add_usage(usage)
+                    if text:
+                        texts.append(text)
+                        queue.put_nowait(text)
+            finally:
+                queue.put_nowait(end_of_stream)
+
+        producer = asyncio.create_task(produce())
+        completed = False
+        try:
+            finished = False
+            while not finished:
+                parts = [await queue.get()]
+                while not queue.empty():
+                    parts.append(queue.get_nowait())
+                if parts[-1] is end_of_stream:
+                    parts.pop()
+                    finished = True
+                if parts:
+                    yield "".join(parts)
+            # Surface any error raised while streaming
+            await producer
+            completed = True
+        finally:
+            if not producer.done():
+                producer.cancel()
+            # Tokens are billed even when the consumer stops early or the stream fails, so record what arrived
+            if completed or turn.has_usage:
+                turn.text = "".join(texts)
+                self._record_turn(message, turn)
+
+    async def _aiter_stream_chunks(self, message: str) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Yield (text, usage_metadata) for each AI message chunk streamed from a fork of the conversation."""
+        base_messages = await self._aget_conversation_messages()
         input_messages = [HumanMessage(content=message)]
 
-        async for chunk, metadata in self.app.stream({"messages": input_messages}, config, stream_mode="messages"):
-            if isinstance(chunk, AIMessage):
-                yield chunk.content
+        async with self._afork_thread(base_messages) as config:
+            async for chunk, metadata in self.app.astream(
+                {"messages": input_messages}, config, stream_mode="messages"
+            ):
+                if isinstance(chunk, AIMessage):
+                    yield _content_to_text(chunk.content), chunk.usage_metadata
@@ -10,6 +10,9 @@ from .base_chat import BaseAssistantChat
 
 logger = logging.getLogger(__name__)
 
+# Configure read timeout to 300 seconds
+BOTO_CONFIG = Config(read_timeout=300)
+
 
 class AssistantChatBedrock(ChatBedrock, BaseAssistantChat):
     """Bedrock chat model with LangGraph support."""
@@ -42,20 +45,18 @@ def create_bedrock_chat(config, session_name: str) -> AssistantChatBedrock:
     model = config.model
 
     logger.info(f"Using Bedrock model: {model} for session: {session_name}")
-    if "AWS_DEFAULT_REGION" not in os.environ:
+    region_name = os.environ.get("AWS_DEFAULT_REGION")
+    if region_name is None:
         raise ValueError("AWS_DEFAULT_REGION key not found in environment")
 
-    # Configure read timeout to 300 seconds
-    boto_config = Config(read_timeout=300)
-
     return AssistantChatBedrock(
         model_id=model,
         model_kwargs={
             "temperature": config.temperature,
             "max_tokens": config.max_tokens,
         },
-        region_name=os.environ["AWS_DEFAULT_REGION"],
+        region_name=region_name,
         verbose=config.verbose,
         session_name=session_name,
-        config=boto_config,
+        config=BOTO_CONFIG,
     )
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from omegaconf import DictConfig
 
@@ -13,17 +13,63 @@ from .sagemaker_chat import SagemakerEndpointChat, create_sagemaker_chat, get_sa
 
 logger = logging.getLogger(__name__)
 
+VALID_PROVIDERS = ("azure", "openai", "bedrock", "anthropic", "sagemaker")
+
 
 class ChatLLMFactory:
     """Factory class for creating chat models with LangGraph support."""
 
+    # Model listings keyed by (provider, AWS region for Bedrock), each stored in order and as a frozenset
+    # for constant-time validation; only successful lookups are cached
+    _valid_models_cache: Dict[Tuple[str, Optional[str]], Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
     @staticmethod
     def get_total_token_usage(save_path: Optional[str] = None) -> Dict[str, Any]:
         """Get total token usage across all conversations and sessions."""
         return GlobalTokenTracker().get_total_usage(save_path)
 
     @classmethod
-    def get_valid_models(cls, provider):
+    def get_valid_models(cls, provider) -> List[str]:
+        """Get the models available for a provider.
+
+        Listing models is a network call, and single-turn agents build a new chat model on every call,
+        so model listings are fetched once per process. SageMaker endpoints come and go, so they are
+        always fetched fresh.
+        """
+        valid_models, _ = cls._get_valid_model_listing(provider)
+        return valid_models
+
+    @classmethod
+    def _get_valid_model_listing(cls, provider) -> Tuple[List[str], FrozenSet[str]]:
+        """Return the models available for a provider as an ordered list and a frozenset, from one lookup."""
+        if provider == "sagemaker":
+            models = cls._fetch_valid_models(provider)
+            return models, frozenset(models)
+
+        cache_key = cls._valid_models_cache_key(provider)
+        if cache_key not in cls._valid_models_cache:
+            models = cls._fetch_valid_models(provider)
+            if not models:
+                # Lookups that failed return an empty list; retry them next time
+                return models, frozenset()
+            # Fetching Bedrock models sets a default region when none is set, so key by the region used
+            cache_key = cls._valid_models_cache_key(provider)
+            cls._valid_models_cache[cache_key] = (tuple(models), frozenset(models))
+        ordered, model_set = cls._valid_models_cache[cache_key]
+        return list(ordered), model_set
+
+    @classmethod
+    def clear_model_cache(cls) -> None:
+        """Drop cached model listings so the next lookup fetches them again."""
+        cls._valid_models_cache.clear()
+
+    @staticmethod
+    def _valid_models_cache_key(provider) -> Tuple[str, Optional[str]]:
+        region = os.environ.get("AWS_DEFAULT_REGION") if provider == "bedrock" else None
+        return (provider, region)
+
+    @classmethod
+    def _fetch_valid_models(cls, provider) -> List[str]:
         if provider == "azure":
             return get_azure_models()
         elif provider == "openai":
@@ -39,7 +85,7 @@ class ChatLLMFactory:
 
     @classmethod
     def get_valid_providers(cls):
-        return ["azure", "openai", "bedrock", "anthropic", "sagemaker"]
+        return list(VALID_PROVIDERS)
 
     @classmethod
     def get_chat_model(cls, config: DictConfig, session_name: str) -> Union[
@@ -53,14 +99,13 @@ class ChatLLMFactory:
         provider = config.provider
         model = config.model
 
-        valid_providers = cls.get_valid_providers()
-        if provider not in valid_providers:
-            raise ValueError(f"Invalid provider: {provider}. Must be one of {valid_providers}")
+        if provider not in VALID_PROVIDERS:
+            raise ValueError(f"Invalid provider: {provider}. Must be one of {cls.get_valid_providers()}")
 
         if provider != "sagemaker":
-            valid_models = cls.get_valid_models(provider)
-            if model not in valid_models:
-                if model[3:] not in valid_models:  # TODO: better logic for cross region inference
+            valid_models, valid_model_set = cls._get_valid_model_listing(provider)
+            if model not in valid_model_set:
+                if model[3:] not in valid_model_set:  # TODO: better logic for cross region inference
                     raise ValueError(
                         f"Invalid model: {model} for provider {provider}. All valid models are {valid_models}. If you are using Bedrock, please check if the requested model is available in the provided AWS_DEFAULT_REGION: {os.environ.get('AWS_DEFAULT_REGION')}"
                     )
@@ -5,10 +5,13 @@ from typing import Any, Dict, List
 from langchain_openai import ChatOpenAI
 from openai import OpenAI
 
-from .base_chat import BaseAssistantChat
+from .base_chat import OPTIONAL_CONFIG_FIELDS, BaseAssistantChat, get_optional_kwargs
 
 logger = logging.getLogger(__name__)
 
+# A proxy_url in the config replaces the OpenAI API base URL
+OPENAI_OPTIONAL_CONFIG_FIELDS = OPTIONAL_CONFIG_FIELDS + (("proxy_url", "openai_api_base"),)
+
 
 class AssistantChatOpenAI(ChatOpenAI, BaseAssistantChat):
     """OpenAI chat model with LangGraph support."""
@@ -36,24 +39,17 @@ def create_openai_chat(config, session_name: str) -> AssistantChatOpenAI:
     """Create an OpenAI chat model instance."""
     model = config.model
 
-    if "OPENAI_API_KEY" not in os.environ:
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if api_key is None:
         raise ValueError("OpenAI API key not found in environment")
 
     logger.info(f"Using OpenAI model: {model} for session: {session_name}")
     kwargs = {
         "model_name": model,
-        "openai_api_key": os.environ["OPENAI_API_KEY"],
+        "openai_api_key": api_key,
         "session_name": session_name,
         "max_tokens": config.max_tokens,
+        **get_optional_kwargs(config, OPENAI_OPTIONAL_CONFIG_FIELDS),
     }
 
-    if hasattr(config, "temperature"):
-        kwargs["temperature"] = config.temperature
-
-    if hasattr(config, "verbose"):
-        kwargs["verbose"] = config.verbose
-
-    if hasattr(config, "proxy_url"):
-        kwargs["openai_api_base"] = config.proxy_url
-
     return AssistantChatOpenAI(**kwargs)
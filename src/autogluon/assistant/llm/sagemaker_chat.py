@@ -1,26 +1,36 @@
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 import boto3
 from botocore.config import Config
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models.llms import LLM
+from pydantic import Field
 
 from .base_chat import BaseAssistantChat
 
 logger = logging.getLogger(__name__)
 
+# Shared by every runtime client; the timeout does not vary per request
+BOTO_CONFIG = Config(read_timeout=300)
+
 
 class SagemakerEndpointChat(LLM, BaseAssistantChat):
     """SageMaker endpoint chat model with LangGraph support."""
 
+    # Endpoints are plain text-completion LLMs: they cannot bind tools, and their output is not
+    # streamed as chat message chunks
+    supports_tools: ClassVar[bool] = False
+    supports_streaming: ClassVar[bool] = False
+
     endpoint_name: str
     inference_component_name: Optional[str] = None
     region_name: str = "us-west-2"
     model_kwargs: Dict[str, Any] = {}
     creds_file: Optional[str] = None
+    sagemaker_runtime: Optional[Any] = Field(default=None, exclude=True)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -30,15 +40,21 @@ class SagemakerEndpointChat(LLM, BaseAssistantChat):
         return "sagemaker_endpoint_chat"
 
     def _get_sagemaker_runtime(self):
-        # Refresh credentials before getting the client if creds_file is provided
+        # Credentials in creds_file are rotated externally, so refresh them and build a client per call
         if self.creds_file:
             refresh_aws_credentials(self.creds_file)
 
-        # Create a new session to force credential refresh
-        session = boto3.Session()
+            # Create a new session to force credential refresh
+            session = boto3.Session()
+            return session.client("sagemaker-runtime", region_name=self.region_name, config=BOTO_CONFIG)
 
-        boto_config = Config(read_timeout=300)
-        return session.client("sagemaker-runtime", region_name=self.region_name, config=boto_config)
+        # Otherwise the client is reused across calls so its connection pool stays warm
+        if self.sagemaker_runtime is None:
+            session = boto3.Session()
+            self.sagemaker_runtime = session.client(
+                "sagemaker-runtime", region_name=self.region_name, config=BOTO_CONFIG
+            )
+        return self.sagemaker_runtime
 
     def _process_output_content(self, result: Dict[str, Any]) -> str:
         """Process the model output to combine all content into a single string.
@@ -118,14 +134,10 @@ class SagemakerEndpointChat(LLM, BaseAssistantChat):
 
     def _serialize_payload(self, payload: Dict[str, Any]) -> bytes:
         """Serialize the payload to bytes."""
-        import json
-
         return json.dumps(payload).encode("utf-8")
 
     def _deserialize_response(self, response: Any) -> Dict[str, Any]:
         """Deserialize the response from bytes."""
-        import json
-
         return json.loads(response["Body"].read().decode())
 
     def describe(self) -> Dict[str, Any]:
@@ -154,8 +166,7 @@ def refresh_aws_credentials(creds_file=None):
     # Always load fresh credentials from file, don't use environment variables
     # Clear existing credentials to force reload
     for key in ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN"]:
-        if key in os.environ:
-            del os.environ[key]
+        os.environ.pop(key, None)
 
     # Look for credentials.txt file that's updated by external process
     try:
@@ -165,10 +176,15 @@ def refresh_aws_credentials(creds_file=None):
                 creds_data = json.load(f)
 
             if "Credentials" in creds_data:
-                # Set environment variables from the freshly read file
-                os.environ["AWS_ACCESS_KEY_ID"] = creds_data["Credentials"]["AccessKeyId"]
-                os.environ["AWS_SECRET_ACCESS_KEY"] = creds_data["Credentials"]["SecretAccessKey"]
-                os.environ["AWS_SESSION_TOKEN"] = creds_data["Credentials"]["SessionToken"]
+                # Set environment variables from the freshly read file in one update
+                credentials = creds_data["Credentials"]
+                os.environ.update(
+                    {
+                        "AWS_ACCESS_KEY_ID": credentials["AccessKeyId"],
+                        "AWS_SECRET_ACCESS_KEY": credentials["SecretAccessKey"],
+                        "AWS_SESSION_TOKEN": credentials["SessionToken"],
+                    }
+                )
                 logger.info("Successfully loaded AWS credentials from file")
             else:
                 logger.warning(f"Credentials file exists but has invalid format: {creds_file}")
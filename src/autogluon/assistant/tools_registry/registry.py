@@ -1,11 +1,11 @@
 import json
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from ..llm import ChatLLMFactory  # Import here to avoid circular imports
 from .utils import split_markdown_into_chunks
 
 logger = logging.getLogger(__name__)
@@ -168,11 +168,13 @@ class ToolsRegistry:
         llm_config=None,
         max_length: int = 9999,
         chunk_size: int = 8192,  # Size of chunks for processing
+        max_workers: int = 4,
     ) -> None:
         """
         Add tutorials to a registered tool, with option to condense them using LLM.
         Processes tutorials chunk by chunk and maintains one LLM session per tutorial.
-        Only generates summaries for condensed tutorials.
+        Only generates summaries for condensed tutorials. Tutorials are independent of each other,
+        so up to max_workers of them are processed concurrently; chunks within a tutorial stay sequential.
 
         Args:
             tool_name: Name of the tool
@@ -181,6 +183,7 @@ class ToolsRegistry:
             llm_config: Configuration for the LLM (required if condense=True)
             max_length: Maximum length for condensed tutorials
             chunk_size: Size of chunks for processing tutorials
+            max_workers: Maximum number of tutorials processed concurrently
         """
         tool_path = self.get_tool_path(tool_name)
         if not tool_path:
@@ -196,36 +199,111 @@ class ToolsRegistry:
         # Create tutorials directory structure
         tutorials_dir = tool_path / "tutorials"
         tutorials_dir.mkdir(exist_ok=True)
+        condensed_dir = tool_path / "condensed_tutorials"
+        condensed_dir.mkdir(exist_ok=True)
 
-        # Process each tutorial file
-        for tutorial_file in tutorials_source.rglob("*.md"):
-            relative_path = tutorial_file.relative_to(tutorials_source)
-            destination = tutorials_dir / relative_path
-            destination.parent.mkdir(parents=True, exist_ok=True)
-
-            # Read original content
-            with open(tutorial_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                first_line = content.split("\n")[0]
-                title = first_line.lstrip("#").strip()
-
-            # Create LLM instance for this tutorial with multi_turn enabled
+        # Shared by every tutorial; only the session name differs per LLM instance
+        tutorial_config = None
+        if llm_config:
             tutorial_config = llm_config.copy()
             tutorial_config.multi_turn = True  # Always enable multi-turn for tutorial processing
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            tutorial_id = f"{tool_name}_{relative_path.stem}_{timestamp}"
-            llm = ChatLLMFactory.get_chat_model(tutorial_config, session_name=tutorial_id)
 
-            if len(content) > 2 * chunk_size:
-                # Process tutorial in chunks using smart markdown splitting
-                chunks = split_markdown_into_chunks(content, max_chunk_size=chunk_size)
-            else:
-                chunks = [content]
-            condensed_chunks = []
+        # Imported lazily so that reading the registry does not load the provider SDKs, and before the
+        # workers start so the first import does not run in several threads at once
+        from ..llm import ChatLLMFactory
+
+        # Process tutorial files concurrently, each with its own LLM session
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._add_tutorial,
+                    tool_name=tool_name,
+                    tutorials_source=tutorials_source,
+                    tutorial_file=tutorial_file,
+                    tutorials_dir=tutorials_dir,
+                    condensed_dir=condensed_dir,
+                    tutorial_config=tutorial_config,
+                    llm_factory=ChatLLMFactory,
+                    max_length=max_length,
+                    chunk_size=chunk_size,
+                )
+                for tutorial_file in tutorials_source.rglob("*.md")
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Stop at the first failure instead of spending LLM calls on the queued tutorials
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def _add_tutorial(
+        self,
+        tool_name: str,
+        tutorials_source: Path,
+        tutorial_file: Path,
+        tutorials_dir: Path,
+        condensed_dir: Path,
+        tutorial_config,
+        llm_factory,
+        max_length: int,
+        chunk_size: int,
+    ) -> None:
+        """Condense and summarize a single tutorial, then write the original and condensed versions."""
+        relative_path = tutorial_file.relative_to(tutorials_source)
+        destination = tutorials_dir / relative_path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        # Read original content
+        with open(tutorial_file, "r", encoding="utf-8") as f:
+            content = f.read()
+            first_line = content.split("\n")[0]
+            title = first_line.lstrip("#").strip()
+
+        # Create LLM instance for this tutorial with multi_turn enabled
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        tutorial_id = f"{tool_name}_{relative_path.stem}_{timestamp}"
+        llm = llm_factory.get_chat_model(tutorial_config, session_name=tutorial_id)
+        condensed_content, tutorial_summary = self._condense_tutorial(llm, content, max_length, chunk_size)
+
+        # Write original content with summary
+        with open(destination, "w", encoding="utf-8") as f:
+            f.write(f"{tutorial_summary}\n\n")
+            f.write(content)
+
+        # Write condensed version with summary
+        condensed_path = condensed_dir / relative_path
+        condensed_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(condensed_path, "w", encoding="utf-8") as f:
+            f.write(f"# Condensed: {title}\n\n")
+            f.write(f"{tutorial_summary}\n\n")
+            f.write("*This is a condensed version that preserves essential implementation details and context.*\n\n")
+            f.write(condensed_content)
+
+    def _condense_tutorial(self, llm, content: str, max_length: int, chunk_size: int) -> Tuple[str, str]:
+        """
+        Condense a tutorial chunk by chunk and summarize it within one multi-turn LLM session.
+
+        Args:
+            llm: Multi-turn chat model dedicated to this tutorial
+            content: Original tutorial content
+            max_length: Maximum length for the condensed tutorial
+            chunk_size: Size of chunks for processing the tutorial
+
+        Returns:
+            Tuple of (condensed content, summary)
+        """
+        if len(content) > 2 * chunk_size:
+            # Process tutorial in chunks using smart markdown splitting
+            chunks = split_markdown_into_chunks(content, max_chunk_size=chunk_size)
+        else:
+            chunks = [content]
+        condensed_chunks = []
 
-            for i, chunk in enumerate(chunks):
-                context = "This is a continuation of the previous chunk. " if i > 0 else ""
-                chunk_prompt = f"""{context}Condense this portion of the tutorial while preserving essential implementation details, code samples, and key concepts. Focus on:
+        for i, chunk in enumerate(chunks):
+            context = "This is a continuation of the previous chunk. " if i > 0 else ""
+            chunk_prompt = f"""{context}Condense this portion of the tutorial while preserving essential implementation details, code samples, and key concepts. Focus on:
 
 1. Implementation details and techniques
 2. Code snippets with necessary context
@@ -237,14 +315,14 @@ Chunk {i+1}/{len(chunks)}:
 
 Provide the condensed content in markdown format."""
 
-                condensed_chunk = llm.assistant_chat(chunk_prompt)
-                condensed_chunks.append(condensed_chunk)
+            condensed_chunk = llm.assistant_chat(chunk_prompt)
+            condensed_chunks.append(condensed_chunk)
 
-            # Combine chunks and generate summary
-            condensed_content = "\n\n".join(condensed_chunks)
+        # Combine chunks and generate summary
+        condensed_content = "\n\n".join(condensed_chunks)
 
-            # Generate summary using the same LLM instance
-            summary_prompt = f"""Generate a concise summary (within 100 words) of this tutorial that helps a code generation LLM understand:
+        # Generate summary using the same LLM instance
+        summary_prompt = f"""Generate a concise summary (within 100 words) of this tutorial that helps a code generation LLM understand:
 1. What specific implementation knowledge or techniques it can find in this tutorial
 2. What coding tasks this tutorial can help with
 3. Key features or functionalities covered
@@ -254,40 +332,23 @@ Tutorial content:
 
 Provide the summary in a single paragraph starting with "Summary: "."""
 
-            tutorial_summary = llm.assistant_chat(summary_prompt)
-            if not tutorial_summary.startswith("Summary: "):
-                tutorial_summary = "Summary: " + tutorial_summary
-
-            # Truncate if needed while preserving complete sections
-            if len(condensed_content) > max_length:
-                last_section = condensed_content[:max_length].rfind("\n#")
-                if last_section > 0:
-                    truncate_point = last_section
-                else:
-                    truncate_point = condensed_content[:max_length].rfind("\n\n")
-                    if truncate_point == -1:
-                        truncate_point = max_length
-
-                condensed_content = condensed_content[:truncate_point] + "\n\n...(truncated)"
-
-            # Write original content with summary
-            with open(destination, "w", encoding="utf-8") as f:
-                f.write(f"{tutorial_summary}\n\n")
-                f.write(content)
-
-            # Write condensed version with summary
-            condensed_dir = tool_path / "condensed_tutorials"
-            condensed_dir.mkdir(exist_ok=True)
-            condensed_path = condensed_dir / relative_path
-            condensed_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(condensed_path, "w", encoding="utf-8") as f:
-                f.write(f"# Condensed: {title}\n\n")
-                f.write(f"{tutorial_summary}\n\n")
-                f.write(
-                    "*This is a condensed version that preserves essential implementation details and context.*\n\n"
-                )
-                f.write(condensed_content)
+        tutorial_summary = llm.assistant_chat(summary_prompt)
+        if not tutorial_summary.startswith("Summary: "):
+            tutorial_summary = "Summary: " + tutorial_summary
+
+        # Truncate if needed while preserving complete sections
+        if len(condensed_content) > max_length:
+            last_section = condensed_content[:max_length].rfind("\n#")
+            if last_section > 0:
+                truncate_point = last_section
+            else:
+                truncate_point = condensed_content[:max_length].rfind("\n\n")
+                if truncate_point == -1:
+                    truncate_point = max_length
+
+            condensed_content = condensed_content[:truncate_point] + "\n\n...(truncated)"
+
+        return condensed_content, tutorial_summary
 
     def unregister_tool(self, tool_name: str) -> None:
         """
@@ -0,0 +1,487 @@
+# tests/unittests/llm/test_base_chat.py
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, List
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field
+from tenacity import wait_none
+
+from autogluon.assistant.llm import base_chat
+from autogluon.assistant.llm.base_chat import (
+    BACKGROUND_LOOP_WORKERS,
+    BaseAssistantChat,
+    ChatTurn,
+    GlobalTokenTracker,
+    _content_to_text,
+)
+from autogluon.assistant.llm.sagemaker_chat import SagemakerEndpointChat
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that replies with canned responses and records every request it receives."""
+
+    responses: List[str]
+    requests: List[List[Any]] = []
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.requests.append(list(messages))
+        text = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        message = AIMessage(content=text, usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class FakeAssistantChat(FakeChatModel, BaseAssistantChat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.initialize_conversation(self)
+
+
+class CachingFakeAssistantChat(FakeAssistantChat):
+    supports_prompt_caching = True
+
+
+class ToolFakeAssistantChat(FakeAssistantChat):
+    bound_tools: List[str] = []
+
+    def bind_tools(self, tools, **kwargs):
+        self.bound_tools = [tool.name for tool in tools]
+        return self
+
+
+class ToolCallingAssistantChat(ToolFakeAssistantChat):
+    """Calls the lookup tool on its first response and answers on its second."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "lookup", "args": {"query": "docs"}, "id": "call_1"}],
+                usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+            )
+        else:
+            message = AIMessage(
+                content="done", usage_metadata={"input_tokens": 4, "output_tokens": 1, "total_tokens": 5}
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class SlowEchoAssistantChat(FakeAssistantChat):
+    """Echoes the latest message; item N of a batch takes longer the smaller N is."""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+    lock: Any = Field(default_factory=threading.Lock, exclude=True)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        # The graph node calls the model synchronously, so concurrent items run in worker threads
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        text = messages[-1].content
+        try:
+            time.sleep(0.02 * (10 - int(text.split()[-1])))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        message = AIMessage(
+            content=f"echo {text}", usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2}
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class BarrierAssistantChat(FakeAssistantChat):
+    """Synchronous model whose calls only complete once `parties` of them are in flight together."""
+
+    barrier: Any = Field(default=None, exclude=True)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.barrier.wait()
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+class AsyncFakeAssistantChat(FakeAssistantChat):
+    """Model with native async calls that tracks how many are awaiting at once."""
+
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.1)
+        self.in_flight -= 1
+        message = AIMessage(content="ok", usage_metadata={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2})
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class FlakyAssistantChat(FakeAssistantChat):
+    """Fails its first `failures` calls, as a throttled provider would."""
+
+    failures: int = 0
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("throttled")
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+class StreamingFakeAssistantChat(FakeAssistantChat):
+    """Streams the canned response word by word, reporting usage on every chunk."""
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.requests.append(list(messages))
+        text = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        for word in text.split(" "):
+            usage = {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2}
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word + " ", usage_metadata=usage))
+
+
+def count_cache_breakpoints(messages: List[Any]) -> int:
+    return sum(
+        1
+        for msg in messages
+        if isinstance(msg.content, list)
+        for block in msg.content
+        if isinstance(block, dict) and "cache_control" in block
+    )
+
+
+class TestCacheablePrefix:
+
+    @pytest.fixture
+    def chat(self):
+        return CachingFakeAssistantChat(responses=["ok"])
+
+    def test_prefix_sent_once_across_turns(self, chat):
+        """Test a repeated prefix is kept once in the conversation with a single breakpoint"""
+        for i in range(6):
+            assert chat.assistant_chat(f"question {i}", cacheable_prefix="CONTEXT ") == "ok"
+
+        for request in chat.requests:
+            assert count_cache_breakpoints(request) == 1
+        last_request = "".join(_content_to_text(msg.content) for msg in chat.requests[-1])
+        assert last_request.count("CONTEXT ") == 1
+        assert "question 5" in last_request
+
+    def test_changed_prefix_keeps_one_breakpoint(self, chat):
+        """Test only the latest prefix is marked when the prefix changes between turns"""
+        for i in range(6):
+            chat.assistant_chat(f"question {i}", cacheable_prefix=f"CONTEXT {i} ")
+
+        for request in chat.requests:
+            assert count_cache_breakpoints(request) == 1
+        last_request = chat.requests[-1]
+        marked = [msg for msg in last_request if count_cache_breakpoints([msg])]
+        assert _content_to_text(marked[0].content).startswith("CONTEXT 5 ")
+
+        # The stored conversation keeps its original blocks
+        stored = chat.app.get_state(chat.graph_config).values["messages"]
+        assert count_cache_breakpoints(stored) == 6
+
+    def test_prefix_concatenated_without_caching_support(self):
+        """Test providers without prompt caching get the prefix as plain text, once"""
+        chat = FakeAssistantChat(responses=["ok"])
+        chat.assistant_chat("first", cacheable_prefix="CONTEXT ")
+        chat.assistant_chat("second", cacheable_prefix="CONTEXT ")
+
+        texts = [msg.content for msg in chat.requests[-1]]
+        assert "CONTEXT first" in texts
+        assert "second" in texts
+        assert count_cache_breakpoints(chat.requests[-1]) == 0
+
+
+def lookup(query: str) -> str:
+    """Look up a query."""
+    return query
+
+
+class TestRegisterTool:
+
+    def test_register_tool_rebuilds_graph(self):
+        """Test a registered tool is bound and wired into the graph, replacing tools of the same name"""
+        chat = ToolFakeAssistantChat(responses=["ok"])
+        chat.assistant_chat("before")
+
+        chat.register_tool("lookup", lookup)
+        chat.register_tool("lookup", lookup, description="Replacement")
+
+        assert [tool.name for tool in chat.registered_tools] == ["lookup"]
+        assert chat.registered_tools[0].description == "Replacement"
+        assert chat.bound_tools == ["lookup"]
+        assert "tools" in chat.graph.nodes
+        # The conversation so far survives the rebuild
+        assert chat.assistant_chat("after") == "ok"
+        assert len(chat.app.get_state(chat.graph_config).values["messages"]) == 4
+
+    def test_register_tool_failure_leaves_model_unchanged(self):
+        """Test a model that cannot bind tools keeps its tools and graph when registration fails"""
+        chat = FakeAssistantChat(responses=["ok"])
+        app = chat.app
+
+        with pytest.raises(NotImplementedError):
+            chat.register_tool("lookup", lookup)
+
+        assert chat.registered_tools == []
+        assert chat.app is app
+
+    def test_register_tool_unsupported_provider(self):
+        """Test providers without tool support reject registration up front"""
+
+        class NoToolsAssistantChat(ToolFakeAssistantChat):
+            supports_tools = False
+
+        chat = NoToolsAssistantChat(responses=["ok"])
+        with pytest.raises(NotImplementedError, match="does not support tool calling"):
+            chat.register_tool("lookup", lookup)
+        assert chat.registered_tools == []
+        assert SagemakerEndpointChat.supports_tools is False
+
+
+class TestConcurrentChat:
+
+    @pytest.fixture(autouse=True)
+    def no_retry_wait(self, monkeypatch):
+        """Retry batch items without the production backoff"""
+        monkeypatch.setitem(base_chat._RETRY_POLICY, "wait", wait_none())
+
+    def test_batch_items_retried(self):
+        """Test a throttled batch item is retried with the assistant_chat policy"""
+        chat = FlakyAssistantChat(responses=["ok"], failures=2)
+
+        assert chat.assistant_chat_batch(["item 1"]) == ["ok"]
+        assert chat.calls == 1
+        # Failed attempts leave no temporary threads behind
+        assert set(chat.memory.storage) <= {chat.thread_id}
+
+    def test_batch_runs_concurrently_in_input_order(self):
+        """Test batch items overlap up to max_concurrency and come back in input order"""
+        chat = SlowEchoAssistantChat(responses=["unused"])
+        messages = [f"item {i}" for i in range(6)]
+        progress = []
+
+        results = chat.assistant_chat_batch(
+            messages, max_concurrency=3, on_progress=lambda index, response: progress.append(index)
+        )
+
+        assert results == [f"echo item {i}" for i in range(6)]
+        assert chat.max_in_flight == 3
+        assert sorted(progress) == list(range(6))
+        assert [turn["input"] for turn in chat.get_history()] == messages
+        assert chat.input_tokens_ == 6
+
+    def test_batch_sync_model_not_capped_by_cpu_count(self):
+        """Test synchronous models reach a max_concurrency above the default executor size"""
+        parties = os.cpu_count() + 8
+        chat = BarrierAssistantChat(responses=["ok"], barrier=threading.Barrier(parties, timeout=5))
+
+        results = chat.assistant_chat_batch([f"item {i}" for i in range(parties)], max_concurrency=parties)
+
+        assert results == ["ok"] * parties
+
+    def test_batch_async_model_awaits_without_threads(self):
+        """Test async models run more items at once than the loop executor has threads"""
+        chat = AsyncFakeAssistantChat(responses=["unused"])
+        count = BACKGROUND_LOOP_WORKERS + 36
+
+        results = chat.assistant_chat_batch([f"item {i}" for i in range(count)], max_concurrency=count)
+
+        assert results == ["ok"] * count
+        assert chat.max_in_flight == count
+
+    def test_sync_call_from_loop_thread_raises(self):
+        """Test a synchronous chat call from on_progress fails fast instead of deadlocking"""
+        chat = FakeAssistantChat(responses=["ok"])
+        errors = []
+
+        def on_progress(index, response):
+            try:
+                chat.assistant_chat_fork("nested")
+            except RuntimeError as e:
+                errors.append(e)
+
+        assert chat.assistant_chat_batch(["item 1"], on_progress=on_progress) == ["ok"]
+        assert "background event loop thread" in str(errors[0])
+
+    def test_failing_progress_callback_keeps_response(self):
+        """Test an exception from on_progress is logged without discarding the billed response"""
+        chat = FakeAssistantChat(responses=["ok"])
+
+        def on_progress(index, response):
+            raise RuntimeError("callback failed")
+
+        assert chat.assistant_chat_batch(["item 1"], on_progress=on_progress) == ["ok"]
+        assert chat.input_tokens_ == 3
+        assert len(chat.get_history()) == 1
+
+    def test_batch_returns_failures_per_item(self):
+        """Test a failing item is returned as its exception without failing the batch"""
+        chat = SlowEchoAssistantChat(responses=["unused"])
+
+        results = chat.assistant_chat_batch(["item 1", "not a number"])
+
+        assert results[0] == "echo item 1"
+        assert isinstance(results[1], ValueError)
+
+    def test_fork_leaves_conversation_untouched(self):
+        """Test a fork sees earlier turns but adds nothing to the conversation"""
+        chat = FakeAssistantChat(responses=["first answer", "fork answer"])
+        chat.assistant_chat("first")
+        messages_before = chat.app.get_state(chat.graph_config).values["messages"]
+
+        assert chat.assistant_chat_fork("fork question") == "fork answer"
+
+        assert [msg.content for msg in chat.requests[-1][1:]] == ["first", "first answer", "fork question"]
+        assert chat.app.get_state(chat.graph_config).values["messages"] == messages_before
+        # The fork's temporary thread is deleted
+        assert list(chat.memory.storage) == [chat.thread_id]
+
+    @pytest.mark.asyncio
+    async def test_stream_coalesces_chunks_and_records_turn(self):
+        """Test chunks arriving while the consumer is busy are merged and the turn is recorded"""
+        chat = StreamingFakeAssistantChat(responses=["one two three four five"])
+        parts = []
+
+        async for text in chat.assistant_chat_stream("hi"):
+            parts.append(text)
+            # A slow consumer lets the remaining chunks queue up
+            await asyncio.sleep(0.05)
+
+        assert "".join(parts) == "one two three four five "
+        assert len(parts) < 5
+        assert chat.get_history()[-1]["output"] == "one two three four five "
+        assert chat.input_tokens_ == 5
+        assert chat.output_tokens_ == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_early_records_usage(self):
+        """Test usage already streamed is recorded when the consumer stops reading"""
+        chat = StreamingFakeAssistantChat(responses=["one two three four five"])
+        stream = chat.assistant_chat_stream("hi")
+
+        async for text in stream:
+            break
+        await stream.aclose()
+
+        assert chat.input_tokens_ >= 1
+        assert chat.get_history()[-1]["output"].startswith("one ")
+
+    @pytest.mark.asyncio
+    async def test_stream_forks_from_conversation(self):
+        """Test the streamed turn sees earlier turns without being added to the conversation"""
+        chat = StreamingFakeAssistantChat(responses=["first answer", "streamed answer"])
+        chat.assistant_chat("first")
+        messages_before = chat.app.get_state(chat.graph_config).values["messages"]
+
+        parts = [text async for text in chat.assistant_chat_stream("second")]
+
+        assert "".join(parts) == "streamed answer "
+        assert [msg.content for msg in chat.requests[-1][1:]] == ["first", "first answer", "second"]
+        assert chat.app.get_state(chat.graph_config).values["messages"] == messages_before
+        assert list(chat.memory.storage) == [chat.thread_id]
+
+    @pytest.mark.asyncio
+    async def test_stream_unsupported_model(self):
+        """Test models that do not stream chat chunks reject streaming instead of yielding nothing"""
+
+        class NoStreamingAssistantChat(StreamingFakeAssistantChat):
+            supports_streaming = False
+
+        chat = NoStreamingAssistantChat(responses=["ok"])
+        with pytest.raises(NotImplementedError, match="does not support streaming"):
+            async for _ in chat.assistant_chat_stream("hi"):
+                pass
+        assert chat.get_history() == []
+        assert SagemakerEndpointChat.supports_streaming is False
+
+    def test_history_trimmed_to_history_max(self):
+        """Test only the latest history_max turns are kept"""
+        chat = FakeAssistantChat(responses=["ok"], history_max=3)
+        for i in range(5):
+            chat.assistant_chat(f"turn {i}")
+
+        assert [turn["input"] for turn in chat.get_history()] == ["turn 2", "turn 3", "turn 4"]
+        assert [turn["input"] for turn in chat.get_history(limit=2)] == ["turn 3", "turn 4"]
+
+
+class TestGlobalTokenTracker:
+
+    def test_concurrent_creation_returns_one_initialized_tracker(self, monkeypatch):
+        """Test trackers created from many threads at once are the same fully initialized instance"""
+        monkeypatch.setattr(GlobalTokenTracker, "_instance", None)
+        barrier = threading.Barrier(8, timeout=5)
+        trackers = []
+
+        def create():
+            barrier.wait()
+            tracker = GlobalTokenTracker()
+            tracker.add_tokens("conversation", "session", 1, 1)
+            trackers.append(tracker)
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(trackers) == 8
+        assert all(tracker is trackers[0] for tracker in trackers)
+        assert trackers[0].get_total_usage()["total"]["total_input_tokens"] == 8
+
+
+class TestChatTurn:
+
+    def test_tool_call_turn_sums_every_model_response(self):
+        """Test a turn with a tool call records usage of both model responses once"""
+        chat = ToolCallingAssistantChat(responses=["unused"])
+        chat.register_tool("lookup", lookup)
+
+        assert chat.assistant_chat("find the docs") == "done"
+
+        assert chat.calls == 2
+        assert (chat.input_tokens_, chat.output_tokens_) == (7, 3)
+        assert len(chat.get_history()) == 1
+        assert chat.get_history()[0]["input_tokens"] == 7
+
+    def test_from_messages_stops_at_latest_user_message(self):
+        """Test usage from earlier turns is not counted again"""
+        messages = [
+            HumanMessage(content="earlier"),
+            AIMessage(content="old", usage_metadata={"input_tokens": 100, "output_tokens": 100, "total_tokens": 200}),
+            HumanMessage(content="now"),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "lookup", "args": {"query": "x"}, "id": "call_1"}],
+                usage_metadata={"input_tokens": 3, "output_tokens": 2, "total_tokens": 5},
+            ),
+            ToolMessage(content="x", tool_call_id="call_1"),
+            AIMessage(
+                content="done",
+                usage_metadata={
+                    "input_tokens": 4,
+                    "output_tokens": 1,
+                    "total_tokens": 5,
+                    "input_token_details": {"cache_read": 2},
+                },
+            ),
+        ]
+
+        turn = ChatTurn.from_messages(messages)
+
+        assert turn.text == "done"
+        assert (turn.input_tokens, turn.output_tokens, turn.cache_read_tokens) == (7, 3, 2)
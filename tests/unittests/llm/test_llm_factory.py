@@ -0,0 +1,83 @@
+# tests/unittests/llm/test_llm_factory.py
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from omegaconf import OmegaConf
+
+from autogluon.assistant.llm.llm_factory import ChatLLMFactory
+
+
+class TestValidModelsCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty model cache"""
+        ChatLLMFactory.clear_model_cache()
+        yield
+        ChatLLMFactory.clear_model_cache()
+
+    def test_listing_is_cached(self):
+        """Test a successful listing is fetched once"""
+        with patch("autogluon.assistant.llm.llm_factory.get_openai_models", return_value=["gpt-a"]) as fetch:
+            assert ChatLLMFactory.get_valid_models("openai") == ["gpt-a"]
+            assert ChatLLMFactory.get_valid_models("openai") == ["gpt-a"]
+
+        fetch.assert_called_once()
+
+    def test_empty_listing_is_not_cached(self):
+        """Test a failed lookup is retried on the next call"""
+        fetch = Mock(side_effect=[[], ["gpt-a"]])
+        with patch("autogluon.assistant.llm.llm_factory.get_openai_models", fetch):
+            assert ChatLLMFactory.get_valid_models("openai") == []
+            assert ChatLLMFactory.get_valid_models("openai") == ["gpt-a"]
+
+        assert fetch.call_count == 2
+
+    def test_sagemaker_bypasses_cache(self):
+        """Test SageMaker endpoints are always fetched fresh"""
+        with patch("autogluon.assistant.llm.llm_factory.get_sagemaker_endpoints", return_value=["endpoint"]) as fetch:
+            ChatLLMFactory.get_valid_models("sagemaker")
+            ChatLLMFactory.get_valid_models("sagemaker")
+
+        assert fetch.call_count == 2
+
+    def test_bedrock_default_region_is_cached(self, monkeypatch):
+        """Test the listing is keyed by the default region set while fetching Bedrock models"""
+        monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+
+        def fetch_bedrock_models():
+            os.environ["AWS_DEFAULT_REGION"] = "us-west-2"
+            return ["claude"]
+
+        with patch(
+            "autogluon.assistant.llm.llm_factory.get_bedrock_models", side_effect=fetch_bedrock_models
+        ) as fetch:
+            ChatLLMFactory.get_valid_models("bedrock")
+            ChatLLMFactory.get_valid_models("bedrock")
+            assert fetch.call_count == 1
+
+            # A different region has its own listing
+            monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+            ChatLLMFactory.get_valid_models("bedrock")
+            assert fetch.call_count == 2
+
+    def test_clear_model_cache(self):
+        """Test clearing the cache forces the next lookup to fetch again"""
+        with patch("autogluon.assistant.llm.llm_factory.get_openai_models", return_value=["gpt-a"]) as fetch:
+            ChatLLMFactory.get_valid_models("openai")
+            ChatLLMFactory.clear_model_cache()
+            ChatLLMFactory.get_valid_models("openai")
+
+        assert fetch.call_count == 2
+
+    def test_get_chat_model_validates_against_cached_listing(self):
+        """Test model validation reuses the cached listing"""
+        config = OmegaConf.create({"provider": "openai", "model": "gpt-b"})
+        with patch("autogluon.assistant.llm.llm_factory.get_openai_models", return_value=["gpt-a"]) as fetch:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Invalid model: gpt-b"):
+                    ChatLLMFactory.get_chat_model(config, session_name="test")
+
+        fetch.assert_called_once()
@@ -0,0 +1,77 @@
+# tests/unittests/tools_registry/test_registry.py
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from omegaconf import OmegaConf
+
+from autogluon.assistant.llm.llm_factory import ChatLLMFactory
+from autogluon.assistant.tools_registry.registry import ToolsRegistry
+
+
+class FakeTutorialChat:
+    """Stands in for a chat model; waits on a barrier so tutorials only finish if they run concurrently."""
+
+    def __init__(self, barrier=None, error=None):
+        self.barrier = barrier
+        self.error = error
+
+    def assistant_chat(self, message):
+        if self.barrier:
+            self.barrier.wait()
+        if self.error:
+            time.sleep(0.05)
+            raise self.error
+        return "Summary: condensed"
+
+
+class TestAddToolTutorials:
+
+    @pytest.fixture
+    def tutorials(self, tmp_path):
+        """Create a tool directory and a source directory with five tutorials"""
+        tool_dir = tmp_path / "tool"
+        tool_dir.mkdir()
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        for i in range(5):
+            (source_dir / f"tutorial_{i}.md").write_text(f"# Tutorial {i}\n\nBody {i}\n")
+        return tool_dir, source_dir
+
+    @pytest.fixture
+    def registry(self, tutorials):
+        registry = ToolsRegistry()
+        tool_dir, _ = tutorials
+        with patch.object(registry, "get_tool_path", return_value=tool_dir):
+            yield registry
+
+    def test_tutorials_processed_concurrently(self, registry, tutorials):
+        """Test tutorials overlap across workers and each is written with its summary"""
+        tool_dir, source_dir = tutorials
+        barrier = threading.Barrier(5, timeout=5)
+
+        with patch.object(ChatLLMFactory, "get_chat_model", return_value=FakeTutorialChat(barrier)) as get_chat_model:
+            registry.add_tool_tutorials(
+                "tool", source_dir, llm_config=OmegaConf.create({"provider": "openai"}), max_workers=5
+            )
+
+        assert get_chat_model.call_count == 5
+        for i in range(5):
+            assert (tool_dir / "tutorials" / f"tutorial_{i}.md").read_text().startswith("Summary: condensed")
+            assert (tool_dir / "condensed_tutorials" / f"tutorial_{i}.md").exists()
+
+    def test_queued_tutorials_cancelled_after_failure(self, registry, tutorials):
+        """Test a failing tutorial stops the queued ones instead of spending LLM calls on them"""
+        _, source_dir = tutorials
+        chat = FakeTutorialChat(error=RuntimeError("throttled"))
+
+        with patch.object(ChatLLMFactory, "get_chat_model", return_value=chat) as get_chat_model:
+            with pytest.raises(RuntimeError, match="throttled"):
+                registry.add_tool_tutorials(
+                    "tool", source_dir, llm_config=OmegaConf.create({"provider": "openai"}), max_workers=1
+                )
+
+        # The single worker may have picked up the next tutorial before the queue was cancelled
+        assert get_chat_model.call_count <= 2